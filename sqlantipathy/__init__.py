@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from .sqlantipathy import SqlAntipathy
+from .sqlantipathy import SqlAntipathy, Record, make_record_class
+from .bufferedwriter import BufferedWriter
 from .mssqlantipathy import MssqlAntipathy
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import atexit
+import sys
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+logger.setLevel("DEBUG")
+
+
+class BufferedWriter:
+    """Write-behind buffer for single row inserts
+
+    Rows written from any thread are kept in memory, grouped by table and
+    by set of columns, and inserted in batches by a background thread through
+    SqlAntipathy.insert_data. A table is flushed when it reaches
+    max_rows rows, when the buffer reaches max_bytes or when the oldest
+    buffered row is older than max_latency seconds. When the buffer
+    reaches max_buffer_bytes, write blocks until a flush frees memory.
+
+    Buffered rows are always flushed by close, which is also called at
+    interpreter exit and when leaving a ``with`` block.
+
+    A batch that can not be inserted is rolled back and its rows are
+    counted in `failed`; the next flush or close raises RuntimeError
+    reporting the failed tables.
+    """
+
+    def __init__(
+            self,
+            sql,
+            dbname,
+            max_rows=5000,
+            max_bytes=8 * 1024 * 1024,
+            max_latency=1.0,
+            max_buffer_bytes=64 * 1024 * 1024,
+    ):
+        """
+        Args:
+            sql (SqlAntipathy): the instance to write with, it is cloned
+                to open a dedicated connection
+            dbname (str): the database to write to
+            max_rows (int, optional): rows of a table that trigger a flush. Defaults to 5000.
+            max_bytes (int, optional): buffered bytes that trigger a flush. Defaults to 8 MB.
+            max_latency (float, optional): max seconds a row waits in the buffer. Defaults to 1.
+            max_buffer_bytes (int, optional): max bytes kept in memory,
+                including rows being inserted. Defaults to 64 MB.
+        """
+        self.dbname = dbname
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.max_latency = max_latency
+        self.max_buffer_bytes = max_buffer_bytes
+
+        self.sql = sql.clone()
+        self.sql.connect()
+
+        self.written = 0
+        self.failed = 0
+        self._errors = []
+
+        self._buffers = {}
+        self._table_rows = {}
+        self._pending_bytes = 0
+        self._buffer_bytes = 0
+        self._oldest = None
+        self._flush_requested = False
+        self._closing = False
+        self._started = 0
+        self._completed = 0
+        self._condition = threading.Condition()
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, table_name, values):
+        """Buffer a row
+
+        Rows are grouped by their set of columns, so the columns missing
+        from a row are left out of its insert and get their database
+        default, as with insert_one. Unlike insert_one, values are bound
+        as parameters and written unchanged: sql_clean is not applied, so
+        for example "" is written as an empty string, not as NULL.
+
+        Args:
+            table_name (str): the table to write to
+            values (dict): column -> value
+        """
+        size = self._size(values)
+
+        with self._condition:
+            if self._closing:
+                raise ValueError("BufferedWriter is closed!")
+
+            while self._buffer_bytes and self._buffer_bytes + size > self.max_buffer_bytes:
+                self._flush_requested = True
+                self._condition.notify_all()
+                self._condition.wait()
+                if self._closing:
+                    raise ValueError("BufferedWriter is closed!")
+
+            rows = self._buffers.setdefault((table_name, tuple(sorted(values))), [])
+            rows.append(dict(values))
+            table_rows = self._table_rows.get(table_name, 0) + 1
+            self._table_rows[table_name] = table_rows
+            self._pending_bytes += size
+            self._buffer_bytes += size
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+                self._condition.notify_all()
+
+            if table_rows >= self.max_rows or self._pending_bytes >= self.max_bytes:
+                self._flush_requested = True
+                self._condition.notify_all()
+
+    def flush(self):
+        """Insert all the rows buffered so far and wait for completion
+
+        Raises:
+            RuntimeError: if some rows could not be inserted since the
+                last flush
+        """
+        with self._condition:
+            target = self._started + 1
+            self._flush_requested = True
+            self._condition.notify_all()
+            while self._completed < target and self._thread.is_alive():
+                self._condition.wait()
+        self._raise_errors()
+
+    def close(self):
+        """Flush the buffered rows, stop the background thread and close the connection
+
+        Raises:
+            RuntimeError: if some rows could not be inserted since the
+                last flush
+        """
+        with self._condition:
+            if self._closing:
+                return
+            self._closing = True
+            self._condition.notify_all()
+
+        self._thread.join()
+        atexit.unregister(self.close)
+        self.sql.close_connection()
+        logger.info("BufferedWriter closed: {0} rows written, {1} failed".format(
+            self.written, self.failed
+        ))
+        self._raise_errors()
+
+    def _raise_errors(self):
+        with self._condition:
+            errors = self._errors
+            self._errors = []
+        if errors:
+            raise RuntimeError("BufferedWriter failed writing {}".format(", ".join(errors)))
+
+    def _size(self, values):
+        return sys.getsizeof(values) + sum(sys.getsizeof(i) for i in values.values())
+
+    def _timeout(self):
+        if self._oldest is None:
+            return None
+        return self._oldest + self.max_latency - time.monotonic()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not (self._closing or self._flush_requested):
+                    timeout = self._timeout()
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+
+                buffers = self._buffers
+                closing = self._closing
+                flushed_bytes = self._pending_bytes
+                self._buffers = {}
+                self._table_rows = {}
+                self._pending_bytes = 0
+                self._oldest = None
+                self._flush_requested = False
+                self._started += 1
+
+            for (table_name, _), rows in buffers.items():
+                self._insert(table_name, rows)
+
+            with self._condition:
+                self._buffer_bytes -= flushed_bytes
+                self._completed += 1
+                self._condition.notify_all()
+
+            if closing:
+                return
+
+    def _insert(self, table_name, rows):
+        # all the rows of a group have the same columns
+        list_of_columns = list(rows[0])
+        try:
+            exit_code = self.sql.insert_data(
+                table_name, list_of_columns, rows, self.dbname, commit_every=len(rows)
+            )
+        except:
+            logger.exception("")
+            exit_code = 1
+
+        if exit_code:
+            logger.error("BufferedWriter failed writing {0} rows to {1}".format(
+                len(rows), table_name
+            ))
+            with self._condition:
+                self.failed += len(rows)
+                self._errors.append("{0} rows to {1}".format(len(rows), table_name))
+        else:
+            with self._condition:
+                self.written += len(rows)
@@ -9,7 +9,7 @@ import pyodbc
 from datetime import datetime, timezone, timedelta
 import logging
 
-from sqlantipathy import SqlAntipathy
+from sqlantipathy import SqlAntipathy, make_record_class
 
 logger = logging.getLogger(__name__)
 logger.setLevel("DEBUG")
@@ -26,6 +26,18 @@ class MssqlAntipathy(SqlAntipathy):
     insert_statement = """INSERT INTO {0} ({1}) VALUES ({2})"""
 
     bulk_insert_statement = """INSERT INTO {0} ({1}) VALUES {2}"""
+    page_query = """SELECT TOP {page_size} {columns} FROM {table_name} WHERE {where} ORDER BY {key_column}"""
+    parameter_marker = "?"
+    retry_errors = (ConnectionError, pyodbc.OperationalError, pyodbc.InterfaceError)
+    # SQL Server accepts at most 2100 parameters for each statement
+    max_parameters = 2000
+
+    supports_keys_temp_table = True
+    # UNION ALL copies the type of key_column but not its IDENTITY property
+    keys_temp_table_statement = """SELECT TOP 0 {key_column} AS antipathy_key INTO #antipathy_keys FROM {table_name} UNION ALL SELECT TOP 0 {key_column} FROM {table_name}"""
+    keys_temp_table_insert = """INSERT INTO #antipathy_keys (antipathy_key) VALUES (?)"""
+    keys_temp_table_query = """SELECT {columns} FROM {table_name} WHERE {key_column} IN (SELECT antipathy_key FROM #antipathy_keys)"""
+    keys_temp_table_drop = """DROP TABLE #antipathy_keys"""
 
     drivers = {
         'redhat': "/opt/microsoft/msodbcsql17/lib64/libmsodbcsql-17.2.so.0.1",
@@ -117,7 +129,7 @@ class MssqlAntipathy(SqlAntipathy):
             self.connection.autocommit = True
 
 
-    def retrieve_table(self, dbname, qry, json_fields=None):
+    def retrieve_table(self, dbname, qry, json_fields=None, row_type="dict"):
         """Run the query and returns a list of dict
 
         It overwrites original retrieve_table to enable json field parsing.
@@ -126,10 +138,14 @@ class MssqlAntipathy(SqlAntipathy):
             dbname (str):
             qry (str):
             json_fields (list, optional):
+            row_type (str, optional): "dict" or "record". Defaults to "dict".
 
         Returns:
-            list of dict
+            list of dict or list of Record
         """
+        if row_type not in ("dict", "record"):
+            raise ValueError("row_type must be one of dict, record!")
+
         logger.debug("Parsing data")
 
         if json_fields is None:
@@ -138,6 +154,21 @@ class MssqlAntipathy(SqlAntipathy):
         values = self.retrieve(dbname=dbname, qry=qry)
         keys = [i[0] for i in self.cursor.description]
 
+        if row_type == "record":
+            record_class = make_record_class(keys)
+            json_idx = [idx for idx, key in enumerate(keys) if key in json_fields]
+            data = []
+            for record in values:
+                if json_idx:
+                    record = list(record)
+                    for idx in json_idx:
+                        record[idx] = json.loads(record[idx])
+                data.append(record_class(record))
+
+            logger.debug("Data parsed")
+
+            return data
+
         data = []
         for record in values:
             parsed = {}
@@ -217,6 +248,41 @@ class MssqlAntipathy(SqlAntipathy):
             logger.exception("")
             return 1
 
+    def insert_data(self, *args, **kwargs):
+        """Insert a list of dict, see SqlAntipathy.insert_data
+
+        It enables pyodbc fast_executemany, that sends each batch
+        of parameters in a single round-trip.
+        """
+        self.cursor.fast_executemany = True
+        try:
+            return super().insert_data(*args, **kwargs)
+        finally:
+            self.cursor.fast_executemany = False
+
+    def _retrieve_keys_temp_table(self, dbname, table_name, key_column, keys, select):
+        """Load the keys in a temporary table and read the matching rows
+
+        The temporary table copies the type of key_column, keys are loaded
+        with fast_executemany.
+        """
+        self.use_database(dbname)
+        self.cursor.execute(self.keys_temp_table_statement.format(
+            key_column=key_column, table_name=table_name
+        ))
+        try:
+            self.cursor.fast_executemany = True
+            self.cursor.executemany(self.keys_temp_table_insert, [(i,) for i in keys])
+            self.cursor.execute(self.keys_temp_table_query.format(
+                columns=select, table_name=table_name, key_column=key_column
+            ))
+            values = self.cursor.fetchall()
+            description = [i[0] for i in self.cursor.description]
+        finally:
+            self.cursor.fast_executemany = False
+            self.cursor.execute(self.keys_temp_table_drop)
+        return description, values
+
     def _handle_datetimeoffset(dto_value):
         # ref: https://github.com/mkleehammer/pyodbc/issues/134#issuecomment-281739794
         # https://github.com/mkleehammer/pyodbc/wiki/Using-an-Output-Converter-function
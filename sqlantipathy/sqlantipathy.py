@@ -1,13 +1,118 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import copy
+import functools
+import itertools
+import queue
 import re
+import threading
+import time
 import numpy as np
 import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .bufferedwriter import BufferedWriter
 
 logger = logging.getLogger(__name__)
 logger.setLevel("DEBUG")
 
+# python converters used by copy_query to coerce values to the DATA_TYPE
+# of the target columns, as returned by show_table_schema
+schema_type_converters = {
+    "bigint": int,
+    "int": int,
+    "smallint": int,
+    "tinyint": int,
+    "bit": lambda value: int(bool(value)),
+    "float": float,
+    "real": float,
+    "char": str,
+    "varchar": str,
+    "nchar": str,
+    "nvarchar": str,
+    "text": str,
+    "ntext": str,
+}
+
+
+class Record(tuple):
+    """A compact, tuple-backed record
+
+    Records produced by the same query share a single column-index map,
+    so no per-row key table is allocated. Values can be read by position
+    or by column name (``row["col"]``), and a list of records can be
+    passed straight to ``pd.DataFrame``, which reads column names from
+    ``_fields`` as it does with namedtuples.
+
+    As for a dict, ``in`` checks the column names, while iterating a
+    record still gives its values, as for a tuple.
+    """
+
+    __slots__ = ()
+
+    _fields = ()
+    _index = {}
+
+    def __getitem__(self, item):
+        if isinstance(item, str):
+            item = self._index[item]
+        return tuple.__getitem__(self, item)
+
+    def __repr__(self):
+        return "Record({})".format(
+            ", ".join("{0}={1!r}".format(k, v) for k, v in zip(self._fields, self))
+        )
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def keys(self):
+        return self._fields
+
+    def get(self, key, default=None):
+        if key in self._index:
+            return self[key]
+        return default
+
+    def _asdict(self):
+        return dict(zip(self._fields, self))
+
+    def __reduce__(self):
+        # record classes are built at runtime, so they are pickled by fields
+        return _make_record, (self._fields, tuple(self))
+
+
+def make_record_class(keys):
+    """Build a Record subclass for the given column names
+
+    Classes are cached, so queries with the same columns share one class.
+
+    Args:
+        keys (list): column names, as in cursor.description
+
+    Returns:
+        a Record subclass
+    """
+    return _record_class(tuple(keys))
+
+
+@functools.lru_cache(maxsize=256)
+def _record_class(keys):
+    return type(
+        "Record",
+        (Record,),
+        {
+            "__slots__": (),
+            "_fields": keys,
+            "_index": {key: idx for idx, key in enumerate(keys)},
+        },
+    )
+
+
+def _make_record(keys, values):
+    return _record_class(keys)(values)
+
 
 class SqlBasic:
 
@@ -74,6 +179,28 @@ class SqlBasic:
         logger.debug("Closing connection")
         self.connection.close()
 
+    def reconnect(self):
+        """Close the current connection, if any, and open a new one"""
+        if self.connection is not None:
+            try:
+                self.close_connection()
+            except Exception:
+                logger.debug("Error closing connection before reconnecting", exc_info=True)
+        self.connection = None
+        self.cursor = None
+        self.connect()
+
+    def clone(self):
+        """Returns a copy of this instance, with no open connection
+
+        The copy shares the connection parameters, so it can be used to
+        open a second, independent connection to the same server.
+        """
+        other = copy.copy(self)
+        other.connection = None
+        other.cursor = None
+        return other
+
 
 class SqlAntipathy(SqlBasic):
 
@@ -81,6 +208,15 @@ class SqlAntipathy(SqlBasic):
     show_databases_query = "SHOW DATABASES"
     use_database_statement = "USE {}"
     insert_statement = """INSERT INTO {0} ({1}) VALUES ({2})"""
+    page_query = """SELECT {columns} FROM {table_name} WHERE {where} ORDER BY {key_column} LIMIT {page_size}"""
+    keys_query = """SELECT {columns} FROM {table_name} WHERE {key_column} IN ({markers})"""
+    parameter_marker = "%s"
+    max_parameters = 2000
+    # engines that implement _retrieve_keys_temp_table set it to True
+    supports_keys_temp_table = False
+    # errors that mean the connection is lost, so the operation can be retried
+    # on a new connection. Each db engine should add its driver errors.
+    retry_errors = (ConnectionError,)
 
     def __init__(self, hostname, user, password, timeout, connect=False):
 
@@ -131,35 +267,410 @@ class SqlAntipathy(SqlBasic):
         logger.debug("Reading data")
         return self.cursor.fetchall()
 
-    def retrieve_table(self, dbname, qry):
+    def retrieve_table(self, dbname, qry, row_type="dict"):
         """Run the query and returns a list of dict
 
         Each record are represented as a dict, to easily transform data
-        in a pandas dataframe
+        in a pandas dataframe. With row_type="record" each record is
+        a compact Record instead, that shares the column names with all
+        the other records and still supports ``row["col"]`` access.
 
         Args:
             dbname:
             qry:
+            row_type (str, optional): "dict" or "record". Defaults to "dict".
 
         Returns:
-            list of dict
+            list of dict or list of Record
 
         """
+        if row_type not in ("dict", "record"):
+            raise ValueError("row_type must be one of dict, record!")
+
         logger.debug("Parsing data")
         values = self.retrieve(dbname=dbname, qry=qry)
         keys = [i[0] for i in self.cursor.description]
 
-        data = []
-        for record in values:
-            parsed = {}
-            for key, value in zip(keys, record):
-                parsed[key] = value
-            data.append(parsed)
+        if row_type == "record":
+            record_class = make_record_class(keys)
+            data = [record_class(record) for record in values]
+        else:
+            data = []
+            for record in values:
+                parsed = {}
+                for key, value in zip(keys, record):
+                    parsed[key] = value
+                data.append(parsed)
 
         logger.debug("Data parsed")
 
         return data
 
+    def iterate_table(
+            self,
+            dbname,
+            table_name,
+            key_column,
+            columns=None,
+            where=None,
+            page_size=5000,
+            row_type="tuple",
+            max_retries=3,
+    ):
+        """Walk a table in key order, one page at a time
+
+        It uses keyset pagination: each page is a short query that asks
+        for the rows with key greater than the last key already read, so
+        no long-running query is held open and only one page at a time is
+        kept in memory. If a page fails with one of retry_errors (e.g. the
+        connection is dropped) the connection is re-opened and the walk
+        resumes from the last key.
+
+        Args:
+            dbname (str): the name of the database
+            table_name (str): the table (or an aliased sub-query) to walk
+            key_column (str): a unique, sortable, NOT NULL column used as page key
+            columns (list, optional): columns to read. Defaults to all columns.
+            where (str, optional): an additional filter condition
+            page_size (int, optional): rows for each page. Defaults to 5000.
+            row_type (str, optional): "tuple", "dict", "record" or "numpy". Defaults to "tuple".
+            max_retries (int, optional): reconnections allowed for each page. Defaults to 3.
+
+        Yields:
+            list of tuple, list of dict, list of Record or dict of numpy arrays, one for each page
+        """
+        if row_type not in ("tuple", "dict", "record", "numpy"):
+            raise ValueError("row_type must be one of tuple, dict, record, numpy!")
+
+        if columns:
+            columns = list(columns)
+            if key_column not in columns:
+                columns.append(key_column)
+            select = ", ".join(columns)
+        else:
+            select = "*"
+
+        last_key = None
+        while True:
+            conditions = []
+            parameters = []
+            if where:
+                conditions.append("({})".format(where))
+            if last_key is not None:
+                conditions.append("{0} > {1}".format(key_column, self.parameter_marker))
+                parameters.append(last_key)
+
+            qry = self.page_query.format(
+                columns=select,
+                table_name=table_name,
+                where=" AND ".join(conditions) or "1 = 1",
+                key_column=key_column,
+                page_size=page_size,
+            )
+
+            values, keys = self._fetch_page(dbname, qry, parameters, max_retries)
+            if not values:
+                return
+
+            last_key = values[-1][keys.index(key_column)]
+            if last_key is None:
+                raise ValueError(
+                    "key_column {} contains NULL values, it can not be used as page key!".format(key_column)
+                )
+            logger.debug("Page read up to {0} = {1}".format(key_column, last_key))
+
+            if row_type == "numpy":
+                yield {
+                    key: np.array([record[idx] for record in values])
+                    for idx, key in enumerate(keys)
+                }
+            else:
+                yield self._make_rows(keys, values, row_type)
+
+            if len(values) < page_size:
+                return
+
+    def iterate_query(self, dbname, qry, key_column, **kwargs):
+        """Walk the results of a query in key order, one page at a time
+
+        The query is wrapped in a sub-query and paginated with
+        iterate_table, so it must not contain an ORDER BY clause.
+
+        Args:
+            dbname (str): the name of the database
+            qry (str): a query string
+            key_column (str): a unique, sortable column of the query used as page key
+            **kwargs: any other iterate_table argument
+
+        Yields:
+            a page of results, see iterate_table
+        """
+        table_name = "({}) AS page_source".format(qry)
+        return self.iterate_table(dbname, table_name, key_column, **kwargs)
+
+    def _fetch_page(self, dbname, qry, parameters, max_retries):
+        attempt = 0
+        while True:
+            try:
+                if attempt:
+                    self.reconnect()
+                self.use_database(dbname=dbname)
+                if parameters:
+                    self.cursor.execute(qry, parameters)
+                else:
+                    self.cursor.execute(qry)
+                values = self.cursor.fetchall()
+                keys = [i[0] for i in self.cursor.description]
+                return values, keys
+            except self.retry_errors:
+                attempt += 1
+                logger.error("Page query failed ({0}/{1})".format(attempt, max_retries))
+                logger.error("Statement {}".format(qry))
+                logger.exception("")
+                if attempt > max_retries:
+                    raise
+
+    def fan_out(
+            self,
+            qry,
+            databases=None,
+            workers=8,
+            row_type="tuple",
+            errors=None,
+    ):
+        """Run the same query against many databases concurrently
+
+        Each worker thread opens its own connection (see clone), so at
+        most `workers` connections are used. Rows are yielded as soon as
+        the query on their database completes, tagged with the database
+        name. A failing database is logged and skipped, it does not stop
+        the other ones.
+
+        Args:
+            qry (str): a query string
+            databases (list or callable, optional): the databases to query,
+                or a function used to filter show_databases(). Defaults to
+                all the databases.
+            workers (int, optional): size of the connection pool. Defaults to 8.
+            row_type (str, optional): "tuple", "dict" or "record". Defaults to "tuple".
+            errors (dict, optional): if given, it is filled with the failing
+                databases, as dbname -> exception
+
+        Yields:
+            tuple: (dbname, row)
+        """
+        if row_type not in ("tuple", "dict", "record"):
+            raise ValueError("row_type must be one of tuple, dict, record!")
+
+        if databases is None:
+            databases = self.show_databases()
+        elif callable(databases):
+            databases = [i for i in self.show_databases() if databases(i)]
+
+        if hasattr(qry, "read"):
+            qry = qry.read()
+
+        def run(sql, dbname):
+            values = sql.retrieve(dbname=dbname, qry=qry)
+            keys = [i[0] for i in sql.cursor.description]
+            return keys, values
+
+        logger.debug("fan_out on {} databases".format(len(databases)))
+
+        for dbname, result, error in self._run_pooled(run, databases, workers):
+            if error is not None:
+                logger.error("fan_out failed on {}".format(dbname), exc_info=error)
+                if errors is not None:
+                    errors[dbname] = error
+                continue
+
+            keys, values = result
+            for record in self._make_rows(keys, values, row_type):
+                yield dbname, record
+
+    def retrieve_by_keys(
+            self,
+            dbname,
+            table_name,
+            key_column,
+            keys,
+            columns=None,
+            chunk_size=None,
+            workers=1,
+            row_type="tuple",
+            by_key=False,
+            temp_table_threshold=None,
+    ):
+        """Retrieve the rows matching a list of keys
+
+        Keys are deduplicated and split in chunks, each one read with a
+        parameterized ``IN (...)`` query of at most max_parameters
+        parameters, so the statement is always the same and its plan can
+        be reused. With workers > 1 chunks run concurrently on a pool of
+        connections. When there are more than temp_table_threshold keys,
+        engines that support it load the keys in a temporary table and
+        join against it instead; the other ones keep using chunks.
+
+        Args:
+            dbname (str): the name of the database
+            table_name (str): the table to read
+            key_column (str): the column to match keys against
+            keys (iterable): the keys
+            columns (list, optional): columns to read. Defaults to all columns.
+            chunk_size (int, optional): keys for each query. Defaults to max_parameters.
+            workers (int, optional): chunks run concurrently. Defaults to 1.
+            row_type (str, optional): "tuple", "dict" or "record". Defaults to "tuple".
+            by_key (bool, optional): yield (key, row) pairs, so that
+                ``dict(...)`` gives rows keyed by id. Defaults to False.
+            temp_table_threshold (int, optional): use a temporary table
+                above this number of keys. Defaults to None (never).
+
+        Yields:
+            a row, or a (key, row) tuple if by_key is True
+        """
+        if row_type not in ("tuple", "dict", "record"):
+            raise ValueError("row_type must be one of tuple, dict, record!")
+
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return
+
+        if columns:
+            columns = list(columns)
+            if by_key and key_column not in columns:
+                columns.append(key_column)
+            select = ", ".join(columns)
+        else:
+            select = "*"
+
+        logger.debug("retrieve_by_keys {0}.{1}: {2} keys".format(
+            dbname, table_name, len(keys)
+        ))
+
+        if (
+                temp_table_threshold is not None
+                and len(keys) > temp_table_threshold
+                and self.supports_keys_temp_table
+        ):
+            results = [self._retrieve_keys_temp_table(
+                dbname, table_name, key_column, keys, select
+            )]
+        else:
+            chunk_size = min(chunk_size or self.max_parameters, self.max_parameters)
+            chunks = [keys[i:i + chunk_size] for i in range(0, len(keys), chunk_size)]
+            if workers > 1:
+                results = self._retrieve_keys_pooled(
+                    dbname, table_name, key_column, chunks, select, workers
+                )
+            else:
+                results = (
+                    self._retrieve_keys_chunk(dbname, table_name, key_column, chunk, select)
+                    for chunk in chunks
+                )
+
+        for description, values in results:
+            rows = self._make_rows(description, values, row_type)
+            if by_key:
+                idx = description.index(key_column)
+                for record, row in zip(values, rows):
+                    yield record[idx], row
+            else:
+                for row in rows:
+                    yield row
+
+    def _retrieve_keys_chunk(self, dbname, table_name, key_column, chunk, select):
+        qry = self.keys_query.format(
+            columns=select,
+            table_name=table_name,
+            key_column=key_column,
+            markers=", ".join([self.parameter_marker] * len(chunk)),
+        )
+        self.use_database(dbname)
+        self.cursor.execute(qry, chunk)
+        values = self.cursor.fetchall()
+        return [i[0] for i in self.cursor.description], values
+
+    def _retrieve_keys_pooled(self, dbname, table_name, key_column, chunks, select, workers):
+        def run(sql, idx):
+            return sql._retrieve_keys_chunk(
+                dbname, table_name, key_column, chunks[idx], select
+            )
+
+        for idx, result, error in self._run_pooled(run, range(len(chunks)), workers):
+            if error is not None:
+                logger.error("retrieve_by_keys failed on chunk {}".format(idx))
+                raise error
+            yield result
+
+    def _run_pooled(self, task, items, workers):
+        """Run task(sql, item) for each item on a pool of connections
+
+        Each worker thread opens its own connection (see clone); if a task
+        fails with one of retry_errors that connection is closed and the
+        next item opens a new one. At most `workers` items are submitted
+        at a time, so only their results are kept in memory. Results are
+        yielded as they complete, as (item, result, exception).
+        """
+        local = threading.local()
+        clones = []
+        lock = threading.Lock()
+
+        def run(item):
+            if getattr(local, "sql", None) is None:
+                sql = self.clone()
+                sql.connect()
+                with lock:
+                    clones.append(sql)
+                local.sql = sql
+            try:
+                return task(local.sql, item)
+            except self.retry_errors:
+                # the connection is broken: close it, next item gets a new one
+                sql = local.sql
+                local.sql = None
+                with lock:
+                    clones.remove(sql)
+                try:
+                    sql.close_connection()
+                except Exception:
+                    logger.exception("")
+                raise
+
+        items = iter(items)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        running = {}
+        try:
+            for item in itertools.islice(items, workers):
+                running[executor.submit(run, item)] = item
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = running.pop(future)
+                    for following in itertools.islice(items, 1):
+                        running[executor.submit(run, following)] = following
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        yield item, None, e
+                    else:
+                        yield item, result, None
+        finally:
+            # if the caller stops early only the running items are waited
+            executor.shutdown(wait=True)
+            for sql in clones:
+                try:
+                    sql.close_connection()
+                except Exception:
+                    logger.exception("")
+
+    def _make_rows(self, keys, values, row_type):
+        if row_type == "dict":
+            return [dict(zip(keys, record)) for record in values]
+        if row_type == "record":
+            record_class = make_record_class(keys)
+            return [record_class(record) for record in values]
+        return [tuple(record) for record in values]
+
     def insert_one(self, table_name, values, dbname=None):
         logger.debug("insert_one {0}.{1}".format(dbname, table_name))
 
@@ -223,6 +734,256 @@ class SqlAntipathy(SqlBasic):
         This method must be re-writed for each db engine."""
         pass
 
+    def copy_query(
+            self,
+            target,
+            dbname,
+            qry,
+            target_table_name,
+            target_dbname=None,
+            columns_map=None,
+            coerce_types=False,
+            batch_size=5000,
+            buffer_batches=4,
+            progress=None,
+    ):
+        """Stream the results of a query into a table of another instance
+
+        Rows are fetched from this instance in batches by a background
+        thread and inserted in the target with insert_data while the
+        next batches are read. At most `buffer_batches` batches are kept
+        in memory.
+        Source and target must use different connections (see clone).
+
+        Args:
+            target (SqlAntipathy): the instance to write to
+            dbname (str): the source database
+            qry (str): the query that reads the source data
+            target_table_name (str): the table to write to
+            target_dbname (str, optional): the target database. Defaults to dbname.
+            columns_map (dict, optional): source column -> target column.
+                Columns not in the map keep their name.
+            coerce_types (bool, optional): convert values to the types
+                returned by target.show_table_schema, when the target
+                implements it. Defaults to False.
+            batch_size (int, optional): rows for each batch. Defaults to 5000.
+            buffer_batches (int, optional): batches in flight. Defaults to 4.
+            progress (callable, optional): called after each batch with
+                (rows copied, rows per second)
+
+        Returns:
+            int: 0 on success, 1 on failure
+
+        Raises:
+            ValueError: if source and target share the same connection
+        """
+        if target is self or target.connection is self.connection:
+            raise ValueError("source and target must use different connections!")
+
+        if target_dbname is None:
+            target_dbname = dbname
+        if columns_map is None:
+            columns_map = {}
+        if hasattr(qry, "read"):
+            qry = qry.read()
+
+        logger.debug("copy_query {0} -> {1}.{2}".format(
+            dbname, target_dbname, target_table_name
+        ))
+
+        try:
+            self.use_database(dbname)
+            self.cursor.execute(qry)
+            source_columns = [i[0] for i in self.cursor.description]
+        except:
+            logger.error("copy_query statement: {}".format(qry))
+            logger.exception("")
+            return 1
+
+        list_of_columns = [columns_map.get(i, i) for i in source_columns]
+
+        converters = [None] * len(list_of_columns)
+        if coerce_types:
+            if not hasattr(target, "show_table_schema"):
+                logger.error("coerce_types needs a target with show_table_schema")
+                return 1
+            try:
+                schema = target.show_table_schema(target_dbname, target_table_name)
+            except:
+                logger.error("copy_query could not read the schema of {}".format(target_table_name))
+                logger.exception("")
+                return 1
+            types = {
+                i["COLUMN_NAME"]: schema_type_converters.get(i["DATA_TYPE"].lower())
+                for i in schema
+            }
+            converters = [types.get(i) for i in list_of_columns]
+
+        buffer = queue.Queue(maxsize=buffer_batches)
+        stop = threading.Event()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=1)
+                    return
+                except queue.Full:
+                    continue
+
+        def read():
+            try:
+                while not stop.is_set():
+                    rows = self.cursor.fetchmany(batch_size)
+                    put(rows)
+                    if not rows:
+                        return
+            except Exception as e:
+                logger.exception("")
+                put(e)
+
+        reader = threading.Thread(target=read, daemon=True)
+        reader.start()
+
+        copied = 0
+        start = time.time()
+        try:
+            while True:
+                rows = buffer.get()
+                if isinstance(rows, Exception):
+                    logger.error("copy_query failed reading from source")
+                    return 1
+                if not rows:
+                    break
+
+                data = []
+                for row in rows:
+                    record = {}
+                    for key, converter, value in zip(list_of_columns, converters, row):
+                        if converter is not None and value is not None:
+                            value = converter(value)
+                        record[key] = value
+                    data.append(record)
+
+                if target.insert_data(
+                        target_table_name,
+                        list_of_columns,
+                        data,
+                        target_dbname,
+                        commit_every=batch_size,
+                ):
+                    logger.error("copy_query failed writing to target after {} rows".format(copied))
+                    return 1
+
+                copied += len(data)
+                speed = copied / max(time.time() - start, 1e-6)
+                logger.info("Copied {0} rows ({1:.0f} rows/s)".format(copied, speed))
+                if progress is not None:
+                    progress(copied, speed)
+        except:
+            logger.error("copy_query failed after {} rows".format(copied))
+            logger.exception("")
+            return 1
+        finally:
+            stop.set()
+            reader.join()
+
+        return 0
+
+    def copy_table(
+            self,
+            target,
+            dbname,
+            table_name,
+            target_table_name=None,
+            columns=None,
+            **kwargs
+    ):
+        """Stream a table into another instance
+
+        Args:
+            target (SqlAntipathy): the instance to write to
+            dbname (str): the source database
+            table_name (str): the source table
+            target_table_name (str, optional): the table to write to. Defaults to table_name.
+            columns (list, optional): the columns to copy. Defaults to all columns.
+            **kwargs: any other copy_query argument
+
+        Returns:
+            int: 0 on success, 1 on failure
+        """
+        qry = "SELECT {0} FROM {1}".format(
+            ", ".join(columns) if columns else "*", table_name
+        )
+        return self.copy_query(
+            target,
+            dbname,
+            qry,
+            target_table_name or table_name,
+            **kwargs
+        )
+
+    def insert_data(self, table_name, list_of_columns, data_as_dict, dbname, commit_every=5000):
+        """Insert a list of dict with parameterized executemany statements
+
+        Values are bound as parameters, so they are written unchanged
+        (no sql_clean). Missing columns are written as NULL. Data is
+        committed every commit_every rows; if a statement fails the
+        current batch is rolled back and the method stops.
+
+        Args:
+            table_name (str): the table to write to
+            list_of_columns (list): the columns to write
+            data_as_dict (list of dict): the rows
+            dbname (str): the database to write to
+            commit_every (int, optional): rows for each transaction. Defaults to 5000.
+
+        Returns:
+            int: 0 on success, 1 on failure
+        """
+        logger.debug("insert_data {0}.{1}".format(dbname, table_name))
+
+        statement = self.insert_statement.format(
+            table_name,
+            ", ".join(list_of_columns),
+            ", ".join([self.parameter_marker] * len(list_of_columns)),
+        )
+
+        idx = 0
+        try:
+            self.use_database(dbname)
+            for idx in range(0, len(data_as_dict), commit_every):
+                rows = [
+                    [row.get(key) for key in list_of_columns]
+                    for row in data_as_dict[idx:idx + commit_every]
+                ]
+                self.cursor.executemany(statement, rows)
+                self.connection.commit()
+        except:
+            logger.error("insert_data failed at row {}".format(idx))
+            logger.error("Statement {}".format(statement))
+            logger.exception("")
+            try:
+                self.connection.rollback()
+            except:
+                logger.exception("")
+            return 1
+        return 0
+
+    def buffered_writer(self, dbname, **kwargs):
+        """Returns a BufferedWriter that coalesces single row inserts
+
+        The writer uses its own connection (see clone), so it can be
+        used alongside this instance.
+
+        Args:
+            dbname (str): the database to write to
+            **kwargs: any other BufferedWriter argument
+
+        Returns:
+            BufferedWriter
+        """
+        return BufferedWriter(self, dbname, **kwargs)
+
     def make_list_of_values(self, values_dict, list_of_columns=None, missing_value=None):
         if not list_of_columns:
             list_of_columns = values_dict.keys()
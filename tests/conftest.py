@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sqlite3
+import sys
+import types
+
+import pytest
+
+try:
+    import pyodbc  # noqa: F401
+except ImportError:
+    # sqlantipathy always imports pyodbc for MssqlAntipathy: a stub is enough
+    # to run the SQLite based tests where unixODBC is not installed
+    pyodbc = types.ModuleType("pyodbc")
+    pyodbc.Error = type("Error", (Exception,), {})
+    pyodbc.OperationalError = type("OperationalError", (pyodbc.Error,), {})
+    pyodbc.InterfaceError = type("InterfaceError", (pyodbc.Error,), {})
+    sys.modules["pyodbc"] = pyodbc
+
+from sqlantipathy import SqlAntipathy
+
+
+class SqliteAntipathy(SqlAntipathy):
+    """Minimal SQLite engine, used as a local stand-in for a server
+
+    SQLite has no databases: use_database only records the name.
+    """
+
+    parameter_marker = "?"
+
+    def __init__(self, path):
+        super().__init__(path, None, None, 10)
+        self.dbname = None
+
+    def open_connection(self):
+        self.connection = sqlite3.connect(self.hostname, check_same_thread=False)
+
+    def use_database(self, dbname):
+        self.dbname = dbname
+
+
+@pytest.fixture
+def sqlite(tmp_path):
+    """Returns a function that opens a SqliteAntipathy on a file of tmp_path"""
+    opened = []
+
+    def make(name="main.db", cls=SqliteAntipathy):
+        sql = cls(str(tmp_path / name))
+        sql.connect()
+        opened.append(sql)
+        return sql
+
+    yield make
+
+    for sql in opened:
+        sql.connection.close()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+
+import pytest
+
+from conftest import SqliteAntipathy
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def sql(sqlite):
+    sql = sqlite()
+    sql.cursor.execute("CREATE TABLE e (id INTEGER, msg TEXT)")
+    sql.cursor.execute("CREATE TABLE w (id INTEGER, v REAL DEFAULT 7 NOT NULL)")
+    sql.connection.commit()
+    return sql
+
+
+def count(sql, table="e"):
+    return sql.retrieve("main", "SELECT COUNT(*) FROM {}".format(table))[0][0]
+
+
+def test_flush_on_max_rows(sql):
+    with sql.buffered_writer("main", max_rows=3, max_latency=60) as writer:
+        writer.write("e", {"id": 1, "msg": "a"})
+        writer.write("e", {"id": 2, "msg": "b"})
+        time.sleep(0.1)
+        assert count(sql) == 0
+
+        writer.write("e", {"id": 3, "msg": "c"})
+        assert wait_for(lambda: count(sql) == 3)
+
+
+def test_flush_on_max_latency(sql):
+    with sql.buffered_writer("main", max_rows=1000, max_latency=0.2) as writer:
+        start = time.monotonic()
+        writer.write("e", {"id": 1, "msg": "a"})
+
+        assert wait_for(lambda: count(sql) == 1)
+        assert time.monotonic() - start >= 0.2
+
+
+def test_write_blocks_at_max_buffer_bytes(sql, monkeypatch):
+    release = threading.Event()
+    original = SqliteAntipathy.insert_data
+
+    def slow_insert_data(self, *args, **kwargs):
+        release.wait(5)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(SqliteAntipathy, "insert_data", slow_insert_data)
+
+    writer = sql.buffered_writer("main", max_rows=1, max_buffer_bytes=1)
+    writer.write("e", {"id": 1, "msg": "a"})
+
+    second = threading.Thread(target=writer.write, args=("e", {"id": 2, "msg": "b"}))
+    second.start()
+    time.sleep(0.2)
+    assert second.is_alive()
+
+    release.set()
+    second.join(5)
+    assert not second.is_alive()
+
+    writer.close()
+    assert count(sql) == 2
+
+
+def test_close_flushes_then_raises_on_failed_batches(sql):
+    writer = sql.buffered_writer("main", max_latency=60)
+    writer.write("e", {"id": 1, "msg": "a"})
+    writer.write("missing", {"id": 1})
+
+    with pytest.raises(RuntimeError, match="missing"):
+        writer.close()
+
+    assert count(sql) == 1
+    assert (writer.written, writer.failed) == (1, 1)
+
+    with pytest.raises(ValueError):
+        writer.write("e", {"id": 2, "msg": "b"})
+
+
+def test_missing_columns_get_database_default(sql):
+    with sql.buffered_writer("main", max_latency=60) as writer:
+        writer.write("w", {"id": 1, "v": 2.0})
+        writer.write("w", {"id": 2})
+
+    assert sql.retrieve("main", "SELECT id, v FROM w ORDER BY id") == [(1, 2.0), (2, 7.0)]
+
+
+def test_values_are_copied_and_unchanged(sql):
+    with sql.buffered_writer("main", max_latency=60) as writer:
+        row = {"id": 1, "msg": "a/b \"c\" ''"}
+        writer.write("e", row)
+        row["msg"] = "changed"
+        writer.write("e", {"id": 2, "msg": ""})
+
+    assert sql.retrieve("main", "SELECT id, msg FROM e ORDER BY id") == [
+        (1, "a/b \"c\" ''"), (2, "")
+    ]
+
+
+def test_concurrent_writers(sql):
+    writer = sql.buffered_writer("main", max_rows=100, max_latency=0.05)
+
+    def produce(n):
+        for i in range(500):
+            writer.write("e", {"id": n * 1000 + i, "msg": str(n)})
+
+    threads = [threading.Thread(target=produce, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.close()
+
+    assert count(sql) == 4000
+    assert sql.retrieve("main", "SELECT COUNT(DISTINCT id) FROM e")[0][0] == 4000
+    assert (writer.written, writer.failed) == (4000, 0)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import copy
+
+import pytest
+
+
+ROWS = [
+    (1, "n/3", 0.5),
+    (2, 'quote \' and "double"', None),
+    (3, "back\\slash: yes", 1e-9),
+    (4, "", -2.0),
+]
+
+
+@pytest.fixture
+def source(sqlite):
+    sql = sqlite("source.db")
+    sql.cursor.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT, v REAL)")
+    sql.cursor.executemany("INSERT INTO t VALUES (?, ?, ?)", ROWS)
+    sql.connection.commit()
+    return sql
+
+
+@pytest.fixture
+def target(sqlite):
+    sql = sqlite("target.db")
+    sql.cursor.execute("CREATE TABLE u (ident INTEGER, name TEXT, v REAL)")
+    sql.connection.commit()
+    return sql
+
+
+def test_copy_table_round_trip(source, target):
+    progress = []
+    exit_code = source.copy_table(
+        target,
+        dbname="main",
+        table_name="t",
+        target_table_name="u",
+        columns_map={"id": "ident"},
+        batch_size=3,
+        buffer_batches=1,
+        progress=lambda rows, speed: progress.append(rows),
+    )
+
+    assert exit_code == 0
+    assert target.retrieve("main", "SELECT ident, name, v FROM u ORDER BY ident") == ROWS
+    assert progress == [3, 4]
+
+
+def test_copy_query_failures_return_1(source, target):
+    assert source.copy_query(target, "main", "SELECT * FROM missing", "u") == 1
+    assert source.copy_table(target, "main", "t", "missing") == 1
+    assert source.copy_table(target, "main", "t", "u", coerce_types=True) == 1
+
+
+def test_copy_query_rejects_same_connection(source):
+    with pytest.raises(ValueError):
+        source.copy_table(source, "main", "t", "t")
+
+    with pytest.raises(ValueError):
+        source.copy_table(copy.copy(source), "main", "t", "t")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sqlite3
+import threading
+
+import pytest
+
+from conftest import SqliteAntipathy
+
+
+class CountingAntipathy(SqliteAntipathy):
+    """Counts open connections; databases named bad_* fail on use_database"""
+
+    lock = threading.Lock()
+    open_connections = 0
+    max_open_connections = 0
+    used = []
+
+    def open_connection(self):
+        super().open_connection()
+        with self.lock:
+            CountingAntipathy.open_connections += 1
+            CountingAntipathy.max_open_connections = max(
+                CountingAntipathy.max_open_connections, CountingAntipathy.open_connections
+            )
+
+    def close_connection(self):
+        super().close_connection()
+        with self.lock:
+            CountingAntipathy.open_connections -= 1
+
+    def use_database(self, dbname):
+        with self.lock:
+            CountingAntipathy.used.append(dbname)
+        if dbname.startswith("bad_"):
+            raise sqlite3.OperationalError("unknown database {}".format(dbname))
+        super().use_database(dbname)
+
+
+@pytest.fixture
+def sql(sqlite, monkeypatch):
+    monkeypatch.setattr(CountingAntipathy, "open_connections", 0)
+    monkeypatch.setattr(CountingAntipathy, "max_open_connections", 0)
+    monkeypatch.setattr(CountingAntipathy, "used", [])
+    sql = sqlite(cls=CountingAntipathy)
+    sql.cursor.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+    sql.cursor.executemany("INSERT INTO t VALUES (?, ?)", [(1, "a"), (2, "b")])
+    sql.connection.commit()
+    return sql
+
+
+def test_fan_out_tags_rows_and_collects_errors(sql):
+    errors = {}
+    rows = list(sql.fan_out(
+        "SELECT id, name FROM t",
+        databases=["db1", "bad_1", "db2", "bad_2"],
+        workers=2,
+        row_type="dict",
+        errors=errors,
+    ))
+
+    assert sorted((dbname, row["id"]) for dbname, row in rows) == [
+        ("db1", 1), ("db1", 2), ("db2", 1), ("db2", 2)
+    ]
+    assert sorted(errors) == ["bad_1", "bad_2"]
+    assert isinstance(errors["bad_1"], sqlite3.OperationalError)
+
+
+def test_fan_out_database_filter(sql, monkeypatch):
+    monkeypatch.setattr(CountingAntipathy, "show_databases", lambda self: ["db1", "x", "db2"])
+
+    rows = list(sql.fan_out("SELECT id FROM t", databases=lambda name: name.startswith("db")))
+
+    assert sorted(dbname for dbname, row in rows) == ["db1", "db1", "db2", "db2"]
+
+
+@pytest.mark.parametrize("retry", [False, True])
+def test_fan_out_connections_are_bounded(sql, monkeypatch, retry):
+    if retry:
+        monkeypatch.setattr(CountingAntipathy, "retry_errors", (sqlite3.OperationalError,))
+
+    databases = ["bad_{}".format(i) for i in range(50)]
+    errors = {}
+    list(sql.fan_out("SELECT id FROM t", databases=databases, workers=4, errors=errors))
+
+    assert len(errors) == 50
+    # the connection of the instance plus one for each worker
+    assert CountingAntipathy.max_open_connections <= 5
+    assert CountingAntipathy.open_connections == 1
+
+
+def test_fan_out_stops_early(sql):
+    databases = ["db{}".format(i) for i in range(50)]
+    results = sql.fan_out("SELECT id FROM t", databases=databases, workers=2)
+
+    next(results)
+    results.close()
+
+    assert len(CountingAntipathy.used) <= 4
+    assert CountingAntipathy.open_connections == 1
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sqlite3
+
+import pytest
+
+
+@pytest.fixture
+def table(sqlite):
+    sql = sqlite()
+    sql.cursor.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+    sql.cursor.executemany(
+        "INSERT INTO t VALUES (?, ?)", [(i, "n{}".format(i)) for i in range(10)]
+    )
+    sql.connection.commit()
+    return sql
+
+
+def test_iterate_table_pages(table):
+    pages = list(table.iterate_table("main", "t", "id", page_size=3))
+
+    assert [len(page) for page in pages] == [3, 3, 3, 1]
+    assert [row for page in pages for row in page] == [
+        (i, "n{}".format(i)) for i in range(10)
+    ]
+
+
+def test_iterate_table_row_types(table):
+    page = next(table.iterate_table(
+        "main", "t", "id", columns=["name"], where="id > 7", row_type="dict"
+    ))
+    assert page == [{"name": "n8", "id": 8}, {"name": "n9", "id": 9}]
+
+    page = next(table.iterate_table("main", "t", "id", page_size=2, row_type="record"))
+    assert [row["name"] for row in page] == ["n0", "n1"]
+
+    page = next(table.iterate_table("main", "t", "id", page_size=2, row_type="numpy"))
+    assert page["id"].tolist() == [0, 1]
+
+
+def test_iterate_query(table):
+    pages = table.iterate_query(
+        "main", "SELECT id, name FROM t WHERE id % 2 = 0", "id", page_size=2
+    )
+    assert [row[0] for page in pages for row in page] == [0, 2, 4, 6, 8]
+
+
+def test_iterate_table_string_keys_are_bound(sqlite):
+    sql = sqlite()
+    keys = ["a/1", "a/2", "a/3", "a0", "a1", "b", "it's \"quoted\"", "back\\slash"]
+    sql.cursor.execute("CREATE TABLE k (id TEXT PRIMARY KEY)")
+    sql.cursor.executemany("INSERT INTO k VALUES (?)", [(i,) for i in keys])
+
+    pages = sql.iterate_table("main", "k", "id", page_size=2)
+
+    assert sorted(row[0] for page in pages for row in page) == sorted(keys)
+
+
+def test_iterate_table_null_key_raises(sqlite):
+    sql = sqlite()
+    sql.cursor.execute("CREATE TABLE n (id INTEGER UNIQUE)")
+    sql.cursor.executemany("INSERT INTO n VALUES (?)", [(None,), (1,)])
+
+    with pytest.raises(ValueError):
+        list(sql.iterate_table("main", "n", "id", page_size=1))
+
+
+def test_iterate_table_resumes_after_dropped_connection(table, monkeypatch):
+    monkeypatch.setattr(type(table), "retry_errors", (sqlite3.ProgrammingError,))
+    rows = []
+    for page in table.iterate_table("main", "t", "id", page_size=3):
+        rows.extend(page)
+        if len(rows) == 3:
+            table.connection.close()
+
+    assert [row[0] for row in rows] == list(range(10))
+
+
+def test_iterate_table_does_not_retry_sql_errors(table, monkeypatch):
+    connections = []
+    monkeypatch.setattr(type(table), "connect", lambda self: connections.append(self))
+
+    with pytest.raises(sqlite3.OperationalError):
+        list(table.iterate_table("main", "t", "id", where="not valid sql"))
+    assert connections == []
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pickle
+
+import pytest
+
+from sqlantipathy import make_record_class
+
+
+@pytest.fixture
+def records(sqlite):
+    sql = sqlite()
+    sql.cursor.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+    sql.cursor.executemany("INSERT INTO t VALUES (?, ?)", [(1, "n1"), (2, "n2")])
+    return sql.retrieve_table("main", "SELECT id, name FROM t ORDER BY id", row_type="record")
+
+
+def test_record_access(records):
+    row = records[0]
+
+    assert row["name"] == "n1"
+    assert row[0] == 1
+    assert row.get("missing") is None
+    assert row._asdict() == {"id": 1, "name": "n1"}
+    assert list(row.keys()) == ["id", "name"]
+    assert type(records[0]) is type(records[1])
+
+
+def test_record_contains_checks_columns(records):
+    row = records[0]
+
+    assert "name" in row
+    assert "n1" not in row
+    assert "missing" not in row
+
+
+def test_record_pickle(records):
+    loaded = pickle.loads(pickle.dumps(records))
+
+    assert loaded == records
+    assert loaded[1]["name"] == "n2"
+    assert type(loaded[0]) is make_record_class(["id", "name"])
+
+
+def test_record_dataframe(records):
+    pd = pytest.importorskip("pandas")
+
+    df = pd.DataFrame(records)
+
+    assert list(df.columns) == ["id", "name"]
+    assert df["name"].tolist() == ["n1", "n2"]
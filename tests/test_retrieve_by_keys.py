@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from conftest import SqliteAntipathy
+
+
+@pytest.fixture
+def table(sqlite):
+    sql = sqlite()
+    sql.cursor.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+    sql.cursor.executemany(
+        "INSERT INTO t VALUES (?, ?)", [(i, "n{}".format(i)) for i in range(100)]
+    )
+    sql.connection.commit()
+    return sql
+
+
+@pytest.fixture
+def chunks(monkeypatch):
+    """Records the keys of each chunk query"""
+    calls = []
+    original = SqliteAntipathy._retrieve_keys_chunk
+
+    def spy(self, dbname, table_name, key_column, chunk, select):
+        calls.append(list(chunk))
+        return original(self, dbname, table_name, key_column, chunk, select)
+
+    monkeypatch.setattr(SqliteAntipathy, "_retrieve_keys_chunk", spy)
+    return calls
+
+
+def test_retrieve_by_keys_deduplicates_and_chunks(table, chunks):
+    keys = [5, 3, 5, 7, 3, 9, 11, 1000]
+
+    rows = list(table.retrieve_by_keys("main", "t", "id", keys, chunk_size=2))
+
+    assert sorted(rows) == [(3, "n3"), (5, "n5"), (7, "n7"), (9, "n9"), (11, "n11")]
+    assert chunks == [[5, 3], [7, 9], [11, 1000]]
+
+
+def test_retrieve_by_keys_chunk_size_is_capped(table, chunks, monkeypatch):
+    monkeypatch.setattr(SqliteAntipathy, "max_parameters", 10)
+
+    list(table.retrieve_by_keys("main", "t", "id", range(25), chunk_size=1000))
+
+    assert [len(i) for i in chunks] == [10, 10, 5]
+
+
+def test_retrieve_by_keys_by_key(table):
+    rows = dict(table.retrieve_by_keys(
+        "main", "t", "id", [1, 2, 3], columns=["name"], row_type="dict", by_key=True
+    ))
+
+    assert rows == {
+        1: {"name": "n1", "id": 1},
+        2: {"name": "n2", "id": 2},
+        3: {"name": "n3", "id": 3},
+    }
+
+
+def test_retrieve_by_keys_workers(table):
+    rows = list(table.retrieve_by_keys(
+        "main", "t", "id", range(0, 100, 3), chunk_size=4, workers=3, row_type="record"
+    ))
+
+    assert sorted(row["id"] for row in rows) == list(range(0, 100, 3))
+
+
+def test_retrieve_by_keys_temp_table_falls_back_to_chunks(table, chunks):
+    rows = list(table.retrieve_by_keys(
+        "main", "t", "id", range(50), chunk_size=20, temp_table_threshold=10
+    ))
+
+    assert len(rows) == 50
+    assert len(chunks) == 3
+
+
+def test_retrieve_by_keys_no_keys(table, chunks):
+    assert list(table.retrieve_by_keys("main", "t", "id", [])) == []
+    assert chunks == []